@@ -3,8 +3,12 @@
 X Scheduler - Schedule posts (text + images/videos) to X/Twitter
 
 Usage:
-  python "X Scheduler.py" --time "9PM 29-11-2025" [--interval 1h] [--posts-dir ./posts]
+  python "X Scheduler.py" --time "9PM 29-11-2025" [--interval 1h] [--posts-dir ./posts] [--workers 2]
   python "X Scheduler.py" --time "21 29-11-2025" --interval 2h
+  python "X Scheduler.py" --time "9PM 29-11-2025" --dry-run  (print the plan, no browser)
+
+  Posts are scheduled through up to 4 parallel Chrome windows (--workers,
+  default 2); keep the count low to avoid X rate limits.
 
 Post Structure:
   Option 1: Numbered folders (RECOMMENDED - any filenames work)
@@ -46,9 +50,13 @@ import os
 import sys
 import time
 import json
+import heapq
+import queue
 import argparse
+import functools
 import traceback
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -57,6 +65,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
 from rich.console import Console
@@ -72,19 +82,51 @@ POST_BUTTON_WAIT = 20.0
 
 console = Console()
 
+# Supported media extensions (frozenset for O(1) membership tests in find_posts)
+MEDIA_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp4'})
+
+# Compiled once at import so the per-post parsing loops don't pay the
+# re-cache lookup on every call
+_INTERVAL_HOURS = re.compile(r"^(\d+)\s*(h|hr|hrs|hour|hours)$")
+_INTERVAL_MINUTES = re.compile(r"^(\d+)\s*(m|min|mins|minute|minutes)$")
+_INTERVAL_SECONDS = re.compile(r"^(\d+)\s*(s|sec|secs|second|seconds)$")
+
+_SCHEDULE_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        # 12-hour formats with AM/PM
+        r"^(?P<h>\d{1,2}):(?P<m>\d{2})\s*(?P<ampm>AM|PM)\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
+        r"^(?P<h>\d{1,2})\s*(?P<ampm>AM|PM)\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
+        # 24-hour formats (no AM/PM)
+        r"^(?P<h>\d{1,2}):(?P<m>\d{2})\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
+        r"^(?P<h>\d{1,2})\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
+    )
+]
+
+# Cheap "looks like a schedule" check so ordinary caption .txt files don't
+# pay the full parse + ValueError cost in find_posts
+_SCHEDULE_HINT = re.compile(r"^\d{1,2}[:\dAPMapm ]{0,8}\s+\d{1,2}[-/]\d{1,2}[-/]\d{4}$")
+
+def _looks_like_schedule(content):
+    return len(content) < 50 and '\n' not in content and _SCHEDULE_HINT.match(content) is not None
+
 # ---------------- Utilities ----------------
+# Both parsers are memoized: the same schedule string often shows up several
+# times (CLI --time, per-post schedule files, validation retries), and both
+# take a str and return an immutable result, so caching is safe
+@functools.lru_cache(maxsize=256)
 def parse_interval(s: str):
     """Parse interval string like '1h', '30m', '24h' into timedelta"""
     if not s:
         return timedelta(hours=1)
     s = s.strip().lower()
-    m = re.match(r"^(\d+)\s*(h|hr|hrs|hour|hours)$", s)
+    m = _INTERVAL_HOURS.match(s)
     if m:
         return timedelta(hours=int(m.group(1)))
-    m = re.match(r"^(\d+)\s*(m|min|mins|minute|minutes)$", s)
+    m = _INTERVAL_MINUTES.match(s)
     if m:
         return timedelta(minutes=int(m.group(1)))
-    m = re.match(r"^(\d+)\s*(s|sec|secs|second|seconds)$", s)
+    m = _INTERVAL_SECONDS.match(s)
     if m:
         return timedelta(seconds=int(m.group(1)))
     try:
@@ -92,6 +134,7 @@ def parse_interval(s: str):
     except Exception:
         return timedelta(hours=1)
 
+@functools.lru_cache(maxsize=256)
 def parse_schedule_string(s: str):
     """Parse schedule string in multiple formats:
     - 12hr: '9PM 29-11-2025', '9:30PM 29-11-2025'
@@ -100,16 +143,8 @@ def parse_schedule_string(s: str):
     if not s or not s.strip():
         raise ValueError("empty schedule string")
     s = s.strip().replace("/", "-")
-    patterns = [
-        # 12-hour formats with AM/PM
-        r"^(?P<h>\d{1,2}):(?P<m>\d{2})\s*(?P<ampm>AM|PM|am|pm)\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
-        r"^(?P<h>\d{1,2})\s*(?P<ampm>AM|PM|am|pm)\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
-        # 24-hour formats (no AM/PM)
-        r"^(?P<h>\d{1,2}):(?P<m>\d{2})\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
-        r"^(?P<h>\d{1,2})\s+(?P<d>\d{1,2})-(?P<M>\d{1,2})-(?P<y>\d{4})$",
-    ]
-    for p in patterns:
-        m = re.match(p, s, flags=re.IGNORECASE)
+    for pat in _SCHEDULE_PATTERNS:
+        m = pat.match(s)
         if not m:
             continue
         gd = m.groupdict()
@@ -120,105 +155,121 @@ def parse_schedule_string(s: str):
         M = int(gd.get("M"))
         y = int(gd.get("y"))
         
-        # Handle 12-hour format with AM/PM
+        # Handle 12-hour format with AM/PM: single arithmetic normalization
+        # (12AM -> 0, 12PM -> 12) instead of two dependent branches
         if ampm:
-            ampm = ampm.lower()
-            if ampm == "pm" and h < 12:
-                h = h + 12
-            if ampm == "am" and h == 12:
-                h = 0
+            h = (h % 12) + (12 if ampm.lower() == "pm" else 0)
         # For 24-hour format, validate hour range
-        else:
-            if h > 23:
-                raise ValueError(f"invalid 24-hour format: hour {h} must be 0-23")
+        elif h > 23:
+            raise ValueError(f"invalid 24-hour format: hour {h} must be 0-23")
         
         if h < 0 or h > 23 or mnt < 0 or mnt > 59:
             raise ValueError("invalid time")
         return datetime(y, M, d, h, mnt)
     raise ValueError(f"unsupported schedule format: {s}")
 
+def _read_text(path):
+    """Read a small caption/schedule file; binary read + decode skips the
+    TextIOWrapper setup that dominates for these tiny files"""
+    with open(path, 'rb') as fh:
+        return fh.read().decode('utf-8', 'replace').strip()
+
+def _split_name(name):
+    """Split a filename into (stem, lowercased extension with dot)"""
+    stem, sep, ext = name.rpartition('.')
+    if not sep:
+        return name, ''
+    return stem, '.' + ext.lower()
+
+# Positions in the per-post record list used by find_posts
+_MEDIA, _TEXT, _SCHEDULE = 0, 1, 2
+
 def find_posts(posts_dir):
     """Find all posts in the directory. Returns list of (number, media_path, text_content, custom_schedule)"""
     posts = []
-    posts_path = Path(posts_dir)
-    
-    if not posts_path.exists():
+
+    if not os.path.isdir(posts_dir):
         console.print(f"[red]Error: Posts directory '{posts_dir}' not found[/red]")
         return posts
-    
-    # Supported media extensions
-    MEDIA_EXTS = ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp4']
-    
-    # Look for numbered files or folders
+
+    # Look for numbered files or folders in a single directory pass
+    # (DirEntry caches the stat info from the directory read, so no extra syscalls)
     items = {}
-    
-    # Check for numbered files (1.png, 1.txt, 1t.txt, etc.)
-    for file in posts_path.iterdir():
-        if file.is_file():
-            name = file.stem
-            ext = file.suffix.lower()
-            
+
+    with os.scandir(posts_dir) as it:
+        for entry in it:
+            # Numbered folders (any filenames work inside)
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.isdigit():
+                    continue
+                num = int(entry.name)
+                rec = items.setdefault(num, [None, None, None])
+
+                # Look for ANY media, text, and schedule files in folder
+                with os.scandir(entry.path) as folder_it:
+                    for file in folder_it:
+                        if not file.is_file(follow_symlinks=False):
+                            continue
+                        stem, ext = _split_name(file.name)
+                        fname = stem.lower()
+
+                        # Check for schedule files (any filename ending with 't' like 'schedulet.txt', 'timet.txt', or just 't.txt')
+                        if ext == '.txt' and (fname.endswith('t') or fname == 't' or 'time' in fname or 'schedule' in fname):
+                            if not rec[_SCHEDULE]:
+                                content = _read_text(file.path)
+                                # Verify it's actually a schedule format (cheap hint first,
+                                # full parse only when it plausibly matches)
+                                if _looks_like_schedule(content):
+                                    try:
+                                        parse_schedule_string(content)
+                                        rec[_SCHEDULE] = content
+                                        continue
+                                    except Exception:
+                                        pass
+
+                        # Regular media and text files
+                        if ext in MEDIA_EXTS and not rec[_MEDIA]:
+                            rec[_MEDIA] = file.path
+                        elif ext == '.txt' and not rec[_TEXT]:
+                            rec[_TEXT] = _read_text(file.path)
+                continue
+
+            # Numbered files (1.png, 1.txt, 1t.txt, etc.)
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            stem, ext = _split_name(entry.name)
+
             # Check for schedule files (1t.txt, 2t.txt, etc.)
-            if name.endswith('t') and name[:-1].isdigit() and ext == '.txt':
-                num = int(name[:-1])
-                if num not in items:
-                    items[num] = {"media": None, "text": None, "schedule": None}
-                content = file.read_text(encoding='utf-8').strip()
-                items[num]["schedule"] = content
+            if stem.endswith('t') and stem[:-1].isdigit() and ext == '.txt':
+                num = int(stem[:-1])
+                rec = items.setdefault(num, [None, None, None])
+                rec[_SCHEDULE] = _read_text(entry.path)
                 continue
-            
+
             # Regular numbered files
-            if name.isdigit():
-                num = int(name)
-                if num not in items:
-                    items[num] = {"media": None, "text": None, "schedule": None}
+            if stem.isdigit():
+                num = int(stem)
+                rec = items.setdefault(num, [None, None, None])
                 if ext in MEDIA_EXTS:
-                    items[num]["media"] = str(file)
+                    rec[_MEDIA] = entry.path
                 elif ext == '.txt':
-                    items[num]["text"] = file.read_text(encoding='utf-8').strip()
-    
-    # Check for numbered folders (any filenames work inside)
-    for folder in posts_path.iterdir():
-        if folder.is_dir() and folder.name.isdigit():
-            num = int(folder.name)
-            if num not in items:
-                items[num] = {"media": None, "text": None, "schedule": None}
-            
-            # Look for ANY media, text, and schedule files in folder
-            for file in folder.iterdir():
-                if not file.is_file():
-                    continue
-                ext = file.suffix.lower()
-                fname = file.stem.lower()
-                
-                # Check for schedule files (any filename ending with 't' like 'schedulet.txt', 'timet.txt', or just 't.txt')
-                if ext == '.txt' and (fname.endswith('t') or fname == 't' or 'time' in fname or 'schedule' in fname):
-                    if not items[num]["schedule"]:
-                        content = file.read_text(encoding='utf-8').strip()
-                        # Verify it's actually a schedule format
-                        try:
-                            parse_schedule_string(content)
-                            items[num]["schedule"] = content
-                            continue
-                        except Exception:
-                            pass
-                
-                # Regular media and text files
-                if ext in MEDIA_EXTS and not items[num]["media"]:
-                    items[num]["media"] = str(file)
-                elif ext == '.txt' and not items[num]["text"]:
-                    items[num]["text"] = file.read_text(encoding='utf-8').strip()
-    
-    # Convert to sorted list
-    for num in sorted(items.keys()):
-        post = items[num]
-        # Accept posts with media only, text only, or both
-        if post["media"] or post["text"]:
-            posts.append((num, post["media"], post["text"], post["schedule"]))
+                    rec[_TEXT] = _read_text(entry.path)
     
+    # Single sort at the end; accept posts with media only, text only, or both
+    posts = [
+        (num, rec[_MEDIA], rec[_TEXT], rec[_SCHEDULE])
+        for num, rec in sorted(items.items())
+        if rec[_MEDIA] or rec[_TEXT]
+    ]
     return posts
 
 # ---------------- Selenium helpers ----------------
+@functools.lru_cache(maxsize=1)
+def _driver_path():
+    """Resolve the chromedriver binary once; ChromeDriverManager().install()
+    hits the network and checksums the binary on every call"""
+    return ChromeDriverManager().install()
+
 def make_driver():
     """Create Chrome WebDriver instance (non-headless, Twitter detects headless mode)"""
     opts = Options()
@@ -226,139 +277,156 @@ def make_driver():
     opts.add_argument("--no-default-browser-check")
     opts.add_argument("--disable-extensions")
     opts.add_argument("--start-maximized")
-    service = Service(ChromeDriverManager().install())
+    service = Service(_driver_path())
     driver = webdriver.Chrome(service=service, options=opts)
     driver.set_page_load_timeout(60)
     return driver
 
+def _normalize_cookies(cookies, default_domain):
+    """Strip fields CDP/WebDriver reject and make sure each cookie has a domain"""
+    normalized = []
+    for c in cookies:
+        c2 = dict(c)
+        for k in ("sameSite", "_expires", "expires"):
+            c2.pop(k, None)
+        if not c2.get("domain"):
+            c2["domain"] = default_domain
+        normalized.append(c2)
+    return normalized
+
 def load_cookies(driver, base_url, cookie_file):
     """Load cookies from JSON file into browser"""
     if not os.path.exists(cookie_file):
         raise FileNotFoundError(f"Cookie file not found: {cookie_file}")
-    
+
     with open(cookie_file, "r", encoding="utf8") as f:
         cookies = json.load(f)
-    
+
+    default_domain = "." + base_url.split("//", 1)[-1].split("/", 1)[0]
+    normalized = _normalize_cookies(cookies, default_domain)
+
+    # Bulk-set via CDP: one round-trip for the whole cookie jar instead of
+    # one add_cookie round-trip per cookie. CDP takes explicit domains, so
+    # no prior same-origin navigation is needed
     try:
-        driver.get(base_url)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": normalized})
+        loaded = len(normalized)
     except Exception:
-        driver.get("about:blank")
-        driver.get(base_url)
-    
-    time.sleep(0.6)
-    loaded = 0
-    
-    for c in cookies:
-        c2 = dict(c)
-        for k in ("sameSite", "_expires", "expires"):
-            c2.pop(k, None)
+        # Fallback: per-cookie WebDriver calls (these do need a same-origin page)
         try:
-            driver.add_cookie(c2)
-            loaded += 1
+            driver.get(base_url)
         except Exception:
+            driver.get("about:blank")
+            driver.get(base_url)
+        time.sleep(0.6)
+        loaded = 0
+        for c2 in normalized:
             try:
-                minimal = {"name": c.get("name"), "value": c.get("value"), "path": c.get("path", "/")}
-                if c.get("domain"):
-                    minimal["domain"] = c.get("domain")
-                driver.add_cookie(minimal)
+                driver.add_cookie(c2)
                 loaded += 1
             except Exception:
-                pass
-    
+                try:
+                    minimal = {"name": c2.get("name"), "value": c2.get("value"), "path": c2.get("path", "/")}
+                    if c2.get("domain"):
+                        minimal["domain"] = c2.get("domain")
+                    driver.add_cookie(minimal)
+                    loaded += 1
+                except Exception:
+                    pass
+
     driver.get(base_url)
     time.sleep(0.8)
     return loaded
 
+# Candidate locators OR-joined with '|' so each poll costs one WebDriver
+# round-trip instead of one per candidate
+_UPLOAD_PREVIEW_XPATH = (
+    "//div[contains(@data-testid,'composer')]/descendant::img"
+    " | //div[contains(@data-testid,'tweetTextarea')]/descendant::img"
+    " | //section//img[contains(@src,'pbs.twimg.com') or contains(@src,'data:') or contains(@src,'blob:')]"
+)
+
+_POST_BUTTON_XPATH = (
+    "//*[contains(@data-testid,'tweetButton')]"
+    " | //button[normalize-space(.)='Post']"
+    " | //button[normalize-space(.)='Tweet']"
+    " | //div[@role='button' and normalize-space(string(.))='Post']"
+)
+
+def _find_upload_preview(driver):
+    """Return True if an upload preview image with a real src is present"""
+    for el in driver.find_elements(By.XPATH, _UPLOAD_PREVIEW_XPATH):
+        try:
+            src = el.get_attribute("src") or ""
+            if src and len(src) > 5:
+                return True
+        except Exception:
+            pass
+    return False
+
 def wait_for_upload_preview(driver, timeout=UPLOAD_PREVIEW_WAIT):
     """Wait for image upload preview to appear"""
     console.print("  [dim]Waiting for upload preview...[/dim]")
-    start = time.time()
-    while time.time() - start < timeout:
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.15).until(_find_upload_preview)
+        console.print("  [green]✓ Upload preview detected[/green]")
+        return True
+    except TimeoutException:
+        console.print("  [red]✗ Upload preview timeout[/red]")
+        return False
+
+def _find_post_button(driver):
+    """Return the first enabled, visible Post/Tweet button, or False"""
+    els = driver.find_elements(By.XPATH, _POST_BUTTON_XPATH) or []
+    for cand in reversed(els):
         try:
-            candidates = [
-                "//div[contains(@data-testid,'composer')]/descendant::img",
-                "//div[contains(@data-testid,'tweetTextarea')]/descendant::img",
-                "//section//img[contains(@src,'pbs.twimg.com') or contains(@src,'data:') or contains(@src,'blob:')]",
-            ]
-            for xp in candidates:
-                els = driver.find_elements(By.XPATH, xp)
-                if els:
-                    for el in els:
-                        try:
-                            src = el.get_attribute("src") or ""
-                            if src and len(src) > 5:
-                                console.print("  [green]✓ Upload preview detected[/green]")
-                                return True
-                        except Exception:
-                            pass
+            if not cand.is_displayed():
+                continue
+            disabled = cand.get_attribute("disabled")
+            aria_disabled = cand.get_attribute("aria-disabled")
+            if disabled and disabled.lower() not in ("false", "0", ""):
+                continue
+            if aria_disabled and aria_disabled.lower() not in ("false", "0", ""):
+                continue
+            return cand
         except Exception:
-            pass
-        time.sleep(0.6)
-    
-    console.print("  [red]✗ Upload preview timeout[/red]")
+            continue
     return False
 
 def find_clickable_post_button(driver, timeout=POST_BUTTON_WAIT):
     """Find the clickable Post/Tweet button"""
-    xpaths = [
-        "//*[contains(@data-testid,'tweetButton')]",
-        "//button[normalize-space(.)='Post']",
-        "//button[normalize-space(.)='Tweet']",
-        "//div[@role='button' and normalize-space(string(.))='Post']",
-    ]
-    end = time.time() + timeout
-    while time.time() < end:
-        try:
-            for xp in xpaths:
-                els = driver.find_elements(By.XPATH, xp) or []
-                for cand in reversed(els):
-                    try:
-                        if not cand.is_displayed():
-                            continue
-                        disabled = cand.get_attribute("disabled")
-                        aria_disabled = cand.get_attribute("aria-disabled")
-                        if disabled and disabled.lower() not in ("false", "0", ""):
-                            continue
-                        if aria_disabled and aria_disabled.lower() not in ("false", "0", ""):
-                            continue
-                        return cand
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        time.sleep(0.35)
-    return None
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.15).until(_find_post_button)
+    except TimeoutException:
+        return None
 
 def aggressive_click_element(driver, el):
-    """Try multiple methods to click an element"""
-    try:
-        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        time.sleep(0.15)
-    except Exception:
-        pass
-    
-    try:
-        el.click()
-        return True
-    except Exception:
-        pass
-    
-    try:
-        driver.execute_script("arguments[0].click();", el)
-        return True
-    except Exception:
-        pass
-    
+    """Click an element with one JS call: scroll into view, try the native
+    click, and fall back to a synthetic MouseEvent all in-browser, instead
+    of paying a WebDriver round-trip (and exception) per attempt"""
     try:
         driver.execute_script("""
             const el = arguments[0];
-            const ev = new MouseEvent('click', {view: window, bubbles: true, cancelable: true});
-            el.dispatchEvent(ev);
+            el.scrollIntoView({block: 'center'});
+            try { el.click(); return true; } catch (e) {}
+            el.dispatchEvent(new MouseEvent('click', {view: window, bubbles: true, cancelable: true}));
+            return true;
         """, el)
         return True
     except Exception:
         return False
 
+def _schedule_confirmed(driver):
+    """Return True once a toast confirming the scheduled post is visible"""
+    for toast in driver.find_elements(By.CSS_SELECTOR, '[data-testid="toast"]'):
+        try:
+            text = (toast.text or "").lower()
+            if "will send on" in text or "scheduled" in text:
+                return True
+        except Exception:
+            pass
+    return False
+
 def click_final_schedule_button(driver):
     """Click the final Schedule button to confirm"""
     console.print("  [dim]Looking for final Schedule button...[/dim]")
@@ -384,20 +452,16 @@ def click_final_schedule_button(driver):
         console.print("  [green]✓ Clicked final Schedule button[/green]")
         time.sleep(2.0)
         
-        # Verify scheduling
-        start = time.time()
-        while time.time() - start < SCHEDULE_CONFIRM_WAIT:
-            try:
-                matches = driver.find_elements(By.XPATH, "//*[contains(translate(text(),'WILL SEND ON','will send on'),'will send on') or contains(translate(text(),'SCHEDULED','scheduled'),'scheduled')]")
-                if matches:
-                    console.print("  [green]✓ Schedule confirmed[/green]")
-                    return True
-            except Exception:
-                pass
-            time.sleep(0.4)
-        
-        console.print("  [yellow]⚠ Schedule button clicked but confirmation not detected[/yellow]")
-        return True
+        # Verify scheduling: watch for the confirmation toast with a CSS
+        # selector (no XPath translate() scan of the whole document) and
+        # check its text once it appears
+        try:
+            WebDriverWait(driver, SCHEDULE_CONFIRM_WAIT, poll_frequency=0.25).until(_schedule_confirmed)
+            console.print("  [green]✓ Schedule confirmed[/green]")
+            return True
+        except TimeoutException:
+            console.print("  [yellow]⚠ Schedule button clicked but confirmation not detected[/yellow]")
+            return True
     except Exception as e:
         console.print(f"  [red]✗ Error clicking final Schedule: {e}[/red]")
         return False
@@ -428,20 +492,13 @@ def open_schedule_dialog_and_set(driver, schedule_dt):
         console.print("  [green]✓ Opened schedule dialog[/green]")
         time.sleep(1.5)
         
-        # Wait for dialog
-        dialog = None
-        start = time.time()
-        while time.time() - start < 10:
-            try:
-                ds = driver.find_elements(By.XPATH, "//div[@role='dialog']") or []
-                if ds:
-                    dialog = ds[-1]
-                    break
-            except Exception:
-                pass
-            time.sleep(0.3)
-        
-        if not dialog:
+        # Wait for dialog; only a readiness check, the field lookups below
+        # all happen in-browser against document
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.15).until(
+                EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
+            )
+        except TimeoutException:
             console.print("  [red]✗ Schedule dialog not found[/red]")
             return False
         
@@ -460,100 +517,60 @@ def open_schedule_dialog_and_set(driver, schedule_dt):
         ampm = "am" if hour_24 < 12 else "pm"
         
         try:
-            selects = dialog.find_elements(By.XPATH, ".//select")
-            
-            # Set Month (SELECTOR_1)
-            try:
-                month_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_1']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    sel.value = arguments[1];
-                    sel.dispatchEvent(new Event('change', { bubbles: true }));
-                """, month_sel, str(month_num))
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
-            # Set Day (SELECTOR_2)
-            try:
-                day_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_2']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    sel.value = arguments[1];
-                    sel.dispatchEvent(new Event('change', { bubbles: true }));
-                """, day_sel, str(day_num))
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
-            # Set Year (SELECTOR_3)
-            try:
-                year_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_3']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    sel.value = arguments[1];
-                    sel.dispatchEvent(new Event('change', { bubbles: true }));
-                """, year_sel, str(year_num))
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
-            # Set Hour (SELECTOR_4)
-            try:
-                hour_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_4']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    sel.value = arguments[1];
-                    sel.dispatchEvent(new Event('change', { bubbles: true }));
-                """, hour_sel, str(hour_12))
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
-            # Set Minute (SELECTOR_5)
-            try:
-                minute_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_5']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    sel.value = arguments[1];
-                    sel.dispatchEvent(new Event('change', { bubbles: true }));
-                """, minute_sel, str(minute_num))
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
-            # Set AM/PM (SELECTOR_6)
-            try:
-                ampm_sel = dialog.find_element(By.XPATH, ".//select[@id='SELECTOR_6']")
-                driver.execute_script("""
-                    const sel = arguments[0];
-                    const targetText = arguments[1];
-                    for (let i = 0; i < sel.options.length; i++) {
-                        if (sel.options[i].text.toUpperCase() === targetText.toUpperCase()) {
-                            sel.selectedIndex = i;
-                            sel.value = sel.options[i].value;
-                            sel.dispatchEvent(new Event('change', { bubbles: true }));
+            # Set month/day/year/hour/minute/AM-PM in one executeScript call:
+            # the dialog lookup, field assignments and change events all happen
+            # in-browser, so one WebDriver round-trip replaces the per-field
+            # find_element + execute_script pairs (plus the per-field sleeps)
+            driver.execute_script("""
+                const dialogs = document.querySelectorAll('div[role="dialog"]');
+                const dialog = dialogs[dialogs.length - 1];
+                if (!dialog) return false;
+                const vals = arguments[0];
+                ['SELECTOR_1','SELECTOR_2','SELECTOR_3','SELECTOR_4','SELECTOR_5'].forEach((id, i) => {
+                    const sel = dialog.querySelector('#' + id);
+                    if (sel) {
+                        sel.value = vals[i];
+                        sel.dispatchEvent(new Event('change', { bubbles: true }));
+                    }
+                });
+                const ampmSel = dialog.querySelector('#SELECTOR_6');
+                if (ampmSel) {
+                    for (const opt of ampmSel.options) {
+                        if (opt.text.toUpperCase() === vals[5].toUpperCase()) {
+                            ampmSel.value = opt.value;
+                            ampmSel.dispatchEvent(new Event('change', { bubbles: true }));
                             break;
                         }
                     }
-                """, ampm_sel, ampm)
-                time.sleep(0.3)
-            except Exception:
-                pass
-            
+                }
+                return true;
+            """, [str(month_num), str(day_num), str(year_num), str(hour_12), str(minute_num), ampm])
+            time.sleep(0.3)
         except Exception as e:
             console.print(f"  [red]✗ Error setting date/time: {e}[/red]")
             return False
-        
+
         console.print("  [green]✓ Date/time set[/green]")
         time.sleep(2.0)
-        
-        # Click Confirm button
+
+        # Click Confirm button (also resolved in-browser against the open dialog)
         try:
-            confirm_btn = dialog.find_element(By.XPATH, ".//button[normalize-space(.)='Confirm' or normalize-space(.)='OK']")
-            confirm_btn.click()
-            console.print("  [green]✓ Clicked Confirm[/green]")
-            time.sleep(2.0)
+            clicked = driver.execute_script("""
+                const dialogs = document.querySelectorAll('div[role="dialog"]');
+                const dialog = dialogs[dialogs.length - 1];
+                if (!dialog) return false;
+                for (const btn of dialog.querySelectorAll('button')) {
+                    const label = (btn.innerText || '').trim();
+                    if (label === 'Confirm' || label === 'OK') {
+                        btn.click();
+                        return true;
+                    }
+                }
+                return false;
+            """)
+            if clicked:
+                console.print("  [green]✓ Clicked Confirm[/green]")
+                time.sleep(2.0)
         except Exception:
             pass
         
@@ -565,15 +582,48 @@ def open_schedule_dialog_and_set(driver, schedule_dt):
         return False
 
 # ---------------- Main posting function ----------------
-def post_to_x(driver, media_path, text_content, schedule_dt):
-    """Post media (image/video) and/or text to X with scheduling"""
+COMPOSE_URL = "https://x.com/compose/tweet"
+
+def _open_composer(driver, force_reload=False):
+    """Bring the worker's tab to a clean composer. After the first post the
+    SPA is already booted, so route client-side (pushState + popstate) and
+    clear any leftover draft text; fall back to a full navigation if the
+    previous post left the composer dirty (force_reload), if media is still
+    attached, or if the compose dialog doesn't come up."""
     try:
-        # Open composer
-        driver.execute_script("window.open('https://x.com/compose/tweet', '_blank');")
-        time.sleep(0.5)
-        driver.switch_to.window(driver.window_handles[-1])
-        time.sleep(1.0)
-        
+        if not force_reload and driver.current_url.startswith("https://x.com"):
+            clean = driver.execute_script("""
+                if (document.querySelector('[data-testid="attachments"]')) {
+                    return false;  // leftover media: needs a full reload
+                }
+                const t = document.querySelector('[data-testid="tweetTextarea_0"]');
+                if (t) t.innerText = '';
+                window.history.pushState({}, '', '/compose/tweet');
+                window.dispatchEvent(new PopStateEvent('popstate'));
+                return true;
+            """)
+            if clean:
+                # Compose-specific readiness: the textbox must live in the
+                # compose dialog, not the timeline's inline composer
+                WebDriverWait(driver, 5, poll_frequency=0.15).until(
+                    lambda d: "/compose/" in d.current_url
+                    and d.find_elements(By.XPATH, "//div[@role='dialog']//div[@role='textbox']")
+                )
+                return
+    except Exception:
+        pass
+    driver.get(COMPOSE_URL)
+    time.sleep(1.0)
+
+def post_to_x(driver, media_path, text_content, schedule_dt, force_reload=False):
+    """Post media (image/video) and/or text to X with scheduling.
+    The driver is owned by the calling worker, so the composer is opened
+    by navigating the current tab rather than juggling window handles."""
+    try:
+        # Open composer (reuses the warm SPA after the first post unless the
+        # previous post on this driver failed partway through)
+        _open_composer(driver, force_reload=force_reload)
+
         # Add text if provided
         if text_content:
             try:
@@ -592,22 +642,19 @@ def post_to_x(driver, media_path, text_content, schedule_dt):
                 inp = WebDriverWait(driver, 12).until(
                     lambda d: d.find_element(By.CSS_SELECTOR, "input[type='file']")
                 )
+                media = Path(media_path)
                 inp.send_keys(os.path.abspath(media_path))
-                media_type = "video" if Path(media_path).suffix.lower() == '.mp4' else "image"
-                console.print(f"  [green]✓ Uploaded {media_type}: {Path(media_path).name}[/green]")
+                media_type = "video" if media.suffix.lower() == '.mp4' else "image"
+                console.print(f"  [green]✓ Uploaded {media_type}: {media.name}[/green]")
                 
                 upload_ok = wait_for_upload_preview(driver, timeout=UPLOAD_PREVIEW_WAIT)
                 if not upload_ok:
                     console.print("  [red]✗ Upload preview timeout[/red]")
-                    driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
                     return False
-                
+
                 time.sleep(3.0)
             except Exception as e:
                 console.print(f"  [red]✗ Upload error: {e}[/red]")
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
                 return False
         
         # Schedule the post
@@ -618,33 +665,57 @@ def post_to_x(driver, media_path, text_content, schedule_dt):
             console.print("  [bold green]✓ Post scheduled successfully![/bold green]")
         else:
             console.print("  [bold red]✗ Scheduling failed[/bold red]")
-        
-        # Close tab
-        try:
-            driver.close()
-            if driver.window_handles:
-                driver.switch_to.window(driver.window_handles[0])
-        except Exception:
-            pass
-        
+
         return ok
-        
+
     except Exception as e:
         console.print(f"  [red]✗ Exception: {e}[/red]")
-        try:
-            driver.close()
-            if driver.window_handles:
-                driver.switch_to.window(driver.window_handles[0])
-        except Exception:
-            pass
         return False
 
+def resolve_schedules(posts, first_schedule, interval):
+    """Resolve each post to a concrete datetime (custom schedule if provided,
+    otherwise the auto-advancing interval schedule) and return a heap keyed
+    by fire time, so posts with early custom schedules are released first
+    regardless of their number"""
+    plan = []
+    current_schedule = first_schedule
+    for num, media, txt, custom_schedule in posts:
+        if custom_schedule:
+            try:
+                post_schedule = parse_schedule_string(custom_schedule)
+                console.print(f"  [yellow]Post #{num} custom schedule: {post_schedule.strftime('%Y-%m-%d %I:%M %p')}[/yellow]")
+            except Exception as e:
+                console.print(f"  [red]Invalid custom schedule '{custom_schedule}': {e}[/red]")
+                console.print(f"  [yellow]Falling back to interval schedule[/yellow]")
+                post_schedule = current_schedule
+        else:
+            post_schedule = current_schedule
+            current_schedule += interval
+        heapq.heappush(plan, (post_schedule, num, media, txt))
+    return plan
+
+def _post_worker(driver_pool, num, media, txt, schedule_dt):
+    """Run one post through a driver borrowed from the shared pool"""
+    driver = driver_pool.get()
+    try:
+        console.print(f"\n[bold cyan]Post #{num}[/bold cyan]")
+        # A failed post can leave media attached in the composer; force a
+        # full compose reload before this driver is reused
+        dirty = getattr(driver, "_composer_dirty", False)
+        ok = post_to_x(driver, media, txt, schedule_dt, force_reload=dirty)
+        driver._composer_dirty = not ok
+        return ok
+    finally:
+        driver_pool.put(driver)
+
 # ---------------- Main ----------------
 def main():
     parser = argparse.ArgumentParser(description="Schedule posts to X/Twitter")
     parser.add_argument("--posts-dir", default="posts", help="Directory containing posts (default: posts)")
     parser.add_argument("--time", required=True, help='First schedule time (12hr: "9PM 29-11-2025" or 24hr: "21 29-11-2025")')
     parser.add_argument("--interval", default="1h", help='Interval between posts: "1h", "30m", "24h" (default: 1h)')
+    parser.add_argument("--workers", type=int, default=2, help="Parallel browser instances, 1-4 (default: 2; keep low to avoid X rate limits)")
+    parser.add_argument("--dry-run", action="store_true", help="Validate posts and print the schedule plan without launching a browser")
     args = parser.parse_args()
     
     try:
@@ -679,61 +750,67 @@ def main():
             schedule_info = f" [custom: {custom_schedule}]" if custom_schedule else ""
             console.print(f"  {num}. {media_info} + {txt_info}{schedule_info}")
         
-        # Initialize browser
-        console.print("\n[cyan]Initializing browser...[/cyan]")
-        driver = make_driver()
-        
-        # Load cookies
-        console.print("[cyan]Loading X cookies...[/cyan]")
-        loaded = load_cookies(driver, "https://x.com", X_COOKIES)
-        if loaded == 0:
-            console.print("[red]No cookies loaded! Make sure cookies.json exists.[/red]")
-            driver.quit()
+        # Resolve each post's schedule up front and order by fire time
+        plan = resolve_schedules(posts, first_schedule, interval)
+
+        # Dry run: the plan is fully known here, so skip the whole browser
+        # stack (driver download, Chrome boot, cookie load)
+        if args.dry_run:
+            console.print("\n[cyan]Dry run - planned schedule:[/cyan]")
+            for post_schedule, num, media, txt in sorted(plan):
+                media_info = Path(media).name if media else "no media"
+                txt_info = f"{len(txt)} chars" if txt else "no text"
+                console.print(f"  {post_schedule.strftime('%Y-%m-%d %I:%M %p')}  Post #{num} ({media_info} + {txt_info})")
             return
-        console.print(f"[green]✓ Loaded {loaded} cookies[/green]")
-        
-        # Schedule posts
-        current_schedule = first_schedule
-        success_count = 0
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("[cyan]Scheduling posts...", total=len(posts))
-            
-            for num, media, txt, custom_schedule in posts:
-                console.print(f"\n[bold cyan]Post #{num}[/bold cyan]")
-                
-                # Use custom schedule if provided, otherwise use interval-based schedule
-                if custom_schedule:
-                    try:
-                        post_schedule = parse_schedule_string(custom_schedule)
-                        console.print(f"  [yellow]Using custom schedule: {post_schedule.strftime('%Y-%m-%d %I:%M %p')}[/yellow]")
-                    except Exception as e:
-                        console.print(f"  [red]Invalid custom schedule '{custom_schedule}': {e}[/red]")
-                        console.print(f"  [yellow]Falling back to interval schedule[/yellow]")
-                        post_schedule = current_schedule
-                else:
-                    post_schedule = current_schedule
-                
-                ok = post_to_x(driver, media, txt, post_schedule)
-                if ok:
-                    success_count += 1
-                
-                # Only increment interval schedule if no custom schedule was used
-                if not custom_schedule:
-                    current_schedule += interval
-                
-                progress.update(task, advance=1)
-                
-                # Small delay between posts
-                if num < posts[-1][0]:
-                    time.sleep(2)
-        
-        # Cleanup
-        driver.quit()
+
+        # Initialize browser pool (posts are independent, so a few parallel
+        # drivers hide the WebDriver/UI wait latency that dominates runtime)
+        workers = max(1, min(args.workers, 4))
+        console.print(f"\n[cyan]Initializing {workers} browser instance(s)...[/cyan]")
+        driver_pool = queue.Queue()
+        drivers = []
+        try:
+            for _ in range(workers):
+                driver = make_driver()
+                console.print("[cyan]Loading X cookies...[/cyan]")
+                loaded = load_cookies(driver, "https://x.com", X_COOKIES)
+                if loaded == 0:
+                    console.print("[red]No cookies loaded! Make sure cookies.json exists.[/red]")
+                    driver.quit()
+                    for d in drivers:
+                        d.quit()
+                    return
+                console.print(f"[green]✓ Loaded {loaded} cookies[/green]")
+                drivers.append(driver)
+                driver_pool.put(driver)
+
+            # Schedule posts
+            success_count = 0
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("[cyan]Scheduling posts...", total=len(plan))
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    # Pop in heap order so the earliest fire time is submitted first
+                    futures = []
+                    while plan:
+                        post_schedule, num, media, txt = heapq.heappop(plan)
+                        futures.append(pool.submit(_post_worker, driver_pool, num, media, txt, post_schedule))
+                    for fut in as_completed(futures):
+                        if fut.result():
+                            success_count += 1
+                        progress.update(task, advance=1)
+        finally:
+            # Cleanup
+            for d in drivers:
+                try:
+                    d.quit()
+                except Exception:
+                    pass
         
         console.print(f"\n[bold green]✓ Completed: {success_count}/{len(posts)} posts scheduled successfully[/bold green]")
         